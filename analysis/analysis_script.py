@@ -13,13 +13,19 @@ It:
 - Prints a textual summary to stdout
 """
 
+import contextlib
 import csv
-import math
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+import matplotlib
+matplotlib.use("Agg")  # figures are only saved to disk
 import matplotlib.pyplot as plt
 
 
@@ -32,233 +38,335 @@ DEFAULT_CSV_PATH = Path("data/OpenAI-models-6-12-2025.csv")
 FIGURES_DIR = Path("figures")
 FIGURES_DIR.mkdir(exist_ok=True)
 
+# PNG resolution; 150 is enough for checking results, use FIG_DPI=300 for the
+# paper figures. zlib level 1 encodes much faster for slightly larger files.
+FIG_DPI = int(os.environ.get("FIG_DPI", 150))
+SAVEFIG_KWARGS = {"dpi": FIG_DPI, "pil_kwargs": {"compress_level": 1}}
+
 
 # --------- Data loading / cleaning ---------
 
-def load_and_clean(csv_path: Path) -> pd.DataFrame:
+# Column layout of the results CSV exported by the web app. The export joins
+# fields with plain commas and does not quote output_text, so that field can
+# span several comma-separated cells; everything else has a fixed position.
+CSV_HEADER = [
+    "run_id", "id", "provider", "model", "variant",
+    "chars", "tokens_per_char", "output_chars", "output_tokens_per_char",
+    "prompt_tokens", "completion_tokens", "total_tokens",
+    "output_text", "mode", "cost", "responseTime",
+    "reasoning_label", "verbosity_label"
+]
+N_LEADING = 12  # fields before output_text
+N_TRAILING = 5  # fields after output_text
+
+NUM_COLS = [
+    "id", "chars", "tokens_per_char", "output_chars", "output_tokens_per_char",
+    "prompt_tokens", "completion_tokens", "total_tokens", "cost", "responseTime"
+]
+# Parsed directly by Arrow; measurement columns are float so that empty cells
+# become NaN instead of failing the read, everything else stays text.
+ARROW_TYPES = {c: pa.string() for c in CSV_HEADER}
+ARROW_TYPES.update({c: pa.float64() for c in NUM_COLS})
+ARROW_TYPES["id"] = pa.int64()
+NUM_DTYPES = {c: "float64" for c in NUM_COLS}
+NUM_DTYPES["id"] = "int64"
+
+# Low-cardinality label columns, stored as categoricals.
+CATEGORY_COLS = ["model", "variant", "mode", "reasoning_label", "verbosity_label"]
+
+
+def iter_fixed_rows(lines, keep_output_text: bool = True):
     """
-    Load the CSV and reconstruct columns in a way that tolerates commas
-    inside the output_text field.
+    Parse CSV `lines` lazily, yielding rows with output_text re-joined.
 
-    This mirrors the logic used in the interactive analysis environment.
+    Everything between the leading fields and the last 5 belongs to
+    output_text; rows with too few fields are skipped. With
+    keep_output_text=False the field is left out of the yielded rows.
     """
-    with csv_path.open("r", encoding="utf-8") as f:
-        rows = list(csv.reader(f))
-
-    # This header is what we used in the notebook:
-    header = [
-        "run_id", "id", "provider", "model", "variant",
-        "chars", "tokens_per_char", "output_chars", "output_tokens_per_char",
-        "prompt_tokens", "completion_tokens", "total_tokens",
-        "output_text", "mode", "cost", "responseTime",
-        "reasoning_label", "verbosity_label"
-    ]
-
-    clean_rows = []
-    for r in rows[1:]:  # skip header
+    for r in csv.reader(lines):
         L = len(r)
-        if L < 18:
-            # Not enough columns; skip
+        if L < len(CSV_HEADER):
             continue
+        if keep_output_text:
+            yield r[:N_LEADING] + [",".join(r[N_LEADING:L - N_TRAILING])] + r[L - N_TRAILING:]
+        else:
+            yield r[:N_LEADING] + r[L - N_TRAILING:]
+
+
+def coerce_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert NUM_COLS from text, turning cells that are not numbers into NaN."""
+    df[NUM_COLS] = df[NUM_COLS].apply(pd.to_numeric, errors="coerce").astype(NUM_DTYPES)
+    return df
 
-        # Last 4 fields are cost, responseTime, reasoning_label, verbosity_label
-        cost = r[-4]
-        responseTime = r[-3]
-        reasoning = r[-2]
-        verbosity = r[-1]
-        mode = r[-5]
 
-        # Everything between index 12 and L-5 belongs to output_text
-        output_text_parts = r[12:L-5]
-        output_text = ",".join(output_text_parts)
+def read_arrow_csv(csv_path: Path, columns, column_types, on_bad_line) -> pd.DataFrame:
+    """
+    Read the results CSV with the pyarrow reader using the fixed CSV_HEADER
+    layout. The file's own header row is skipped unparsed: its field count
+    depends on which keys the first exported result happened to have.
+    """
+    table = pa_csv.read_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(skip_rows=1, column_names=CSV_HEADER),
+        parse_options=pa_csv.ParseOptions(invalid_row_handler=on_bad_line),
+        convert_options=pa_csv.ConvertOptions(column_types=column_types, include_columns=columns),
+    )
+    return table.to_pandas()
 
-        fixed = r[:12] + [output_text, mode, cost, responseTime, reasoning, verbosity]
-        clean_rows.append(fixed)
 
-    df = pd.DataFrame(clean_rows, columns=header)
+def load_and_clean(csv_path: Path, keep_output_text: bool = False) -> pd.DataFrame:
+    """
+    Load the CSV and reconstruct columns in a way that tolerates commas
+    inside the output_text field.
 
-    # Convert numeric columns
-    num_cols = [
-        "id", "chars", "tokens_per_char", "output_chars", "output_tokens_per_char",
-        "prompt_tokens", "completion_tokens", "total_tokens", "cost", "responseTime"
-    ]
-    for c in num_cols:
-        df[c] = pd.to_numeric(df[c], errors="coerce")
+    Well-formed rows are parsed by the pyarrow CSV reader with a typed
+    schema. If some numeric cell is not a number, the file is read again as
+    text and coerced like the original to_numeric(errors="coerce") pass.
+    Rows with extra fields (commas inside output_text) are handed back by
+    the reader, rebuilt by joining the middle fields and coerced the same way.
 
-    df["id"] = df["id"].astype(int)
+    output_text is not used by the analysis and is dropped unless
+    keep_output_text is set.
+    """
+    columns = [c for c in CSV_HEADER if keep_output_text or c != "output_text"]
+    bad_lines = []
+
+    def collect_bad_line(row):
+        bad_lines.append(row.text)
+        return "skip"
+
+    try:
+        df = read_arrow_csv(csv_path, columns, ARROW_TYPES, collect_bad_line)
+    except pa.ArrowInvalid:
+        bad_lines.clear()
+        text_types = {c: pa.string() for c in CSV_HEADER}
+        df = coerce_numeric(read_arrow_csv(csv_path, columns, text_types, collect_bad_line))
+
+    fixed = pd.DataFrame.from_records(iter_fixed_rows(bad_lines, keep_output_text), columns=columns)
+    if not fixed.empty:
+        df = pd.concat([df, coerce_numeric(fixed)], ignore_index=True)
+
+    for c in CATEGORY_COLS:
+        df[c] = df[c].astype("category")
+    return df
+
+
+def load_cached(csv_path: Path) -> pd.DataFrame:
+    """
+    Same as load_and_clean, but reuses a Parquet copy stored next to the CSV.
+
+    The cache is rebuilt whenever the CSV (or this script) is newer than it.
+    """
+    cache_path = csv_path.with_suffix(".parquet")
+    source_mtime = max(csv_path.stat().st_mtime, Path(__file__).stat().st_mtime)
+    if cache_path.exists() and cache_path.stat().st_mtime >= source_mtime:
+        return pd.read_parquet(cache_path, engine="pyarrow")
+
+    df = load_and_clean(csv_path)
+    try:
+        df.to_parquet(cache_path, engine="pyarrow", compression="zstd")
+    except OSError as e:
+        print(f"Could not write cache {cache_path}: {e}", file=sys.stderr)
+        with contextlib.suppress(OSError):
+            cache_path.unlink(missing_ok=True)
     return df
 
 
 # --------- Core analysis helpers ---------
 
-def summarize_linear(df_sub: pd.DataFrame):
-    """Fit prompt_tokens ≈ a + b * chars and return (n, mean_chars, mean_tokens, a, b, r2)."""
-    X = df_sub["chars"].values
-    y = df_sub["prompt_tokens"].values
-    n = len(X)
-    mean_chars = X.mean()
-    mean_tokens = y.mean()
+VARIANTS = ["en", "tr", "tr_nodia"]
 
-    Sxx = ((X - mean_chars) ** 2).sum()
-    Sxy = ((X - mean_chars) * (y - mean_tokens)).sum()
-    b = Sxy / Sxx
-    a = mean_tokens - b * mean_chars
 
-    y_pred = a + b * X
-    ss_tot = ((y - mean_tokens) ** 2).sum()
-    ss_res = ((y - y_pred) ** 2).sum()
-    r2 = 1 - ss_res / ss_tot
+def summarize_linear(df_sub: pd.DataFrame, by=("model", "variant")) -> pd.DataFrame:
+    """
+    Fit prompt_tokens ≈ a + b * chars separately for every group in `by`.
+
+    Rows are labelled with their group number and all groups are fitted at
+    once from segment sums (np.bincount) of centred values, so there is no
+    per-group Python work. Returns one row per group with n, means,
+    intercept a, slope b and R².
+    """
+    g = df_sub.groupby([df_sub[k] for k in by], sort=True, observed=True)
+    n_groups = g.ngroups
+    codes = g.ngroup().to_numpy()
+    valid = codes >= 0  # rows with a missing key belong to no group
+    codes = codes[valid]
+    xy = df_sub[["chars", "prompt_tokens"]].to_numpy(dtype=np.float64)[valid]
+
+    def segment_sum(w):
+        return np.bincount(codes, weights=w, minlength=n_groups)
+
+    n = np.bincount(codes, minlength=n_groups)
+    mean_x = segment_sum(xy[:, 0]) / n
+    mean_y = segment_sum(xy[:, 1]) / n
+
+    dx = xy[:, 0] - mean_x[codes]
+    dy = xy[:, 1] - mean_y[codes]
+    Sxx = segment_sum(dx * dx)
+    Sxy = segment_sum(dx * dy)
+    Syy = segment_sum(dy * dy)
 
-    return n, mean_chars, mean_tokens, a, b, r2
+    b = Sxy / Sxx
+    a = mean_y - b * mean_x
+    ss_res = Syy - b * Sxy
+    r2 = 1 - ss_res / Syy
+
+    return pd.DataFrame({
+        "n": n,
+        "mean_chars": mean_x,
+        "mean_prompt_tokens": mean_y,
+        "intercept_tokens": a,
+        "slope_tokens_per_char": b,
+        "r2": r2
+    }, index=g.size().index).reset_index()
 
 
 def compute_summaries(df: pd.DataFrame):
+    """Linear fits for every model x VARIANTS pair; groups without rows get n = 0 and NaN fits."""
     models = sorted(df["model"].unique().tolist())
-    variants = ["en", "tr", "tr_nodia"]
-
-    summary_rows = []
-    for model in models:
-        for variant in variants:
-            sub = df[(df.model == model) & (df.variant == variant)]
-            n, mean_chars, mean_tokens, a, b, r2 = summarize_linear(sub)
-            summary_rows.append({
-                "model": model,
-                "variant": variant,
-                "n": n,
-                "mean_chars": mean_chars,
-                "mean_prompt_tokens": mean_tokens,
-                "intercept_tokens": a,
-                "slope_tokens_per_char": b,
-                "r2": r2
-            })
-
-    return pd.DataFrame(summary_rows)
-
-
-def compute_paired_en_tr(df: pd.DataFrame):
-    """Paired EN vs TR differences per model."""
-    models = sorted(df["model"].unique().tolist())
-    rows = []
-
-    for model in models:
-        en = df[(df.model == model) & (df.variant == "en")].set_index("id")
-        tr = df[(df.model == model) & (df.variant == "tr")].set_index("id")
-        ids = sorted(set(en.index) & set(tr.index))
-
-        diffs_tpc = np.array([tr.loc[i, "tokens_per_char"] - en.loc[i, "tokens_per_char"] for i in ids])
-        diffs_pt = np.array([tr.loc[i, "prompt_tokens"] - en.loc[i, "prompt_tokens"] for i in ids])
-
-        n = len(diffs_tpc)
-        t_crit = 1.984  # approx 95% for n~100
-
-        def mean_sd_ci(arr):
-            mean = arr.mean()
-            sd = arr.std(ddof=1)
-            se = sd / math.sqrt(n)
-            ci_low = mean - t_crit * se
-            ci_high = mean + t_crit * se
-            return mean, sd, ci_low, ci_high
-
-        mean_d_tpc, sd_d_tpc, ci_low_tpc, ci_high_tpc = mean_sd_ci(diffs_tpc)
-        mean_d_pt, sd_d_pt, ci_low_pt, ci_high_pt = mean_sd_ci(diffs_pt)
-
-        rows.append({
-            "model": model,
-            "n_pairs": n,
-            "mean_diff_tokens_per_char_tr_minus_en": mean_d_tpc,
-            "sd_diff_tokens_per_char": sd_d_tpc,
-            "ci_low_tpc": ci_low_tpc,
-            "ci_high_tpc": ci_high_tpc,
-            "mean_diff_prompt_tokens_tr_minus_en": mean_d_pt,
-            "sd_diff_prompt_tokens": sd_d_pt,
-            "ci_low_pt": ci_low_pt,
-            "ci_high_pt": ci_high_pt
-        })
-
-    return pd.DataFrame(rows)
-
-
-def compute_paired_tr_nodia(df: pd.DataFrame):
-    """Paired TR_NODIA vs TR differences per model."""
-    models = sorted(df["model"].unique().tolist())
-    rows = []
+    full = pd.MultiIndex.from_product([models, VARIANTS], names=["model", "variant"])
+    summ = summarize_linear(df[df.variant.isin(VARIANTS)]).set_index(["model", "variant"]).reindex(full)
+    summ["n"] = summ["n"].fillna(0).astype(int)
+    return summ.reset_index()
 
-    for model in models:
-        tr = df[(df.model == model) & (df.variant == "tr")].set_index("id")
-        trn = df[(df.model == model) & (df.variant == "tr_nodia")].set_index("id")
-        ids = sorted(set(tr.index) & set(trn.index))
 
-        diffs_tpc = np.array([trn.loc[i, "tokens_per_char"] - tr.loc[i, "tokens_per_char"] for i in ids])
-        n = len(diffs_tpc)
-        t_crit = 1.984
+T_CRIT = 1.984  # approx 95% for n~100
+PAIRED_COLS = ["tokens_per_char", "prompt_tokens"]
 
-        mean_d = diffs_tpc.mean()
-        sd_d = diffs_tpc.std(ddof=1)
-        se_d = sd_d / math.sqrt(n)
-        ci_low = mean_d - t_crit * se_d
-        ci_high = mean_d + t_crit * se_d
 
-        rows.append({
-            "model": model,
-            "n_pairs": n,
-            "mean_diff_tpc_trn_minus_tr": mean_d,
-            "sd_diff": sd_d,
-            "ci_low": ci_low,
-            "ci_high": ci_high
-        })
+def pivot_variants(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Wide frame indexed by (model, id) with one column per (metric, variant).
 
-    return pd.DataFrame(rows)
+    Every (metric, variant) column exists even if a variant is missing from
+    the data. The ("present", variant) columns flag which variants exist
+    for each sentence; they are computed once here and shared by every
+    pairing.
 
+    If the CSV holds several runs (repeated run_id batches), the metrics of
+    a repeated (model, id, variant) are averaged over the runs.
+    """
+    keys = ["model", "id"]
+    wide = df.pivot_table(
+        index=keys, columns="variant", values=PAIRED_COLS, aggfunc="mean", observed=True, dropna=False
+    ).reindex(columns=pd.MultiIndex.from_product([PAIRED_COLS, VARIANTS]))
+    present = (
+        df.groupby(keys + ["variant"], observed=True).size()
+        .unstack("variant", fill_value=0)
+        .reindex(columns=VARIANTS, fill_value=0)
+        > 0
+    )
+    present.columns = pd.MultiIndex.from_product([["present"], present.columns])
+    return wide.join(present)
+
+
+def paired_diffs(wide: pd.DataFrame, base: str, other: str, cols) -> pd.DataFrame:
+    """
+    Per-sentence differences `other − base` for `cols`, indexed by (model, id).
 
-def compute_cost_stats(df: pd.DataFrame):
-    """Mean cost per sentence and TR/EN cost ratio per model."""
-    models = sorted(df["model"].unique().tolist())
-    rows = []
+    Only ids present in both variants for a model are kept.
+    """
+    both = (wide[("present", base)] & wide[("present", other)]).to_numpy()
+    return pd.DataFrame(
+        {
+            c: np.subtract(wide[(c, other)].to_numpy()[both], wide[(c, base)].to_numpy()[both], dtype=np.float64)
+            for c in cols
+        },
+        index=wide.index[both],
+    )
 
-    for model in models:
-        en_cost = df[(df.model == model) & (df.variant == "en")]["cost"].mean()
-        tr_cost = df[(df.model == model) & (df.variant == "tr")]["cost"].mean()
-        ratio = tr_cost / en_cost if en_cost and en_cost > 0 else None
 
-        rows.append({
-            "model": model,
-            "mean_cost_en": en_cost,
-            "mean_cost_tr": tr_cost,
-            "tr_over_en_cost_ratio": ratio
-        })
+def mean_sd_ci(diffs: pd.DataFrame, models):
+    """
+    Per-model n, mean, SD and 95% CI bounds for every column of `diffs`.
 
-    return pd.DataFrame(rows)
+    Every model in `models` gets a row; models without pairs have n = 0
+    and NaN statistics.
 
+    One grouped pass covers all columns; the CI bounds are frame-wide
+    vector ops on the aggregated results. n counts all pairs, so a model
+    with a missing diff gets NaN statistics rather than ones taken over
+    fewer rows than n.
+    """
+    g = diffs.groupby(level="model", sort=True, observed=True)
+    n = g.size().reindex(models, fill_value=0)
+    has_nan = diffs.isna().groupby(level="model", sort=True, observed=True).any().reindex(models, fill_value=False)
+    mean = g.mean().reindex(models).mask(has_nan)
+    sd = g.std(ddof=1).reindex(models).mask(has_nan)
+    se = sd.div(np.sqrt(n), axis=0)
+    return n, mean, sd, mean - T_CRIT * se, mean + T_CRIT * se
 
-# --------- Plotting ---------
 
-def generate_figures(df: pd.DataFrame):
-    models = sorted(df["model"].unique().tolist())
-    model_ref = models[0]  # e.g. gpt-5.1
+def compute_paired_en_tr(wide: pd.DataFrame):
+    """
+    Paired EN vs TR differences per model, from the pivot_variants frame.
+
+    Returns (summary, diffs) where `diffs` holds the per-sentence TR − EN
+    differences indexed by (model, id), for reuse in the figures.
+    """
+    diffs = paired_diffs(wide, "en", "tr", PAIRED_COLS)
+    n, mean, sd, ci_low, ci_high = mean_sd_ci(diffs, wide.index.unique(level="model").sort_values())
+
+    summary = pd.DataFrame({
+        "n_pairs": n,
+        "mean_diff_tokens_per_char_tr_minus_en": mean["tokens_per_char"],
+        "sd_diff_tokens_per_char": sd["tokens_per_char"],
+        "ci_low_tpc": ci_low["tokens_per_char"],
+        "ci_high_tpc": ci_high["tokens_per_char"],
+        "mean_diff_prompt_tokens_tr_minus_en": mean["prompt_tokens"],
+        "sd_diff_prompt_tokens": sd["prompt_tokens"],
+        "ci_low_pt": ci_low["prompt_tokens"],
+        "ci_high_pt": ci_high["prompt_tokens"]
+    }).reset_index()
+
+    return summary, diffs
+
+
+def compute_paired_tr_nodia(wide: pd.DataFrame):
+    """Paired TR_NODIA vs TR differences per model, from the pivot_variants frame."""
+    diffs = paired_diffs(wide, "tr", "tr_nodia", ["tokens_per_char"])
+    n, mean, sd, ci_low, ci_high = mean_sd_ci(diffs, wide.index.unique(level="model").sort_values())
+
+    return pd.DataFrame({
+        "n_pairs": n,
+        "mean_diff_tpc_trn_minus_tr": mean["tokens_per_char"],
+        "sd_diff": sd["tokens_per_char"],
+        "ci_low": ci_low["tokens_per_char"],
+        "ci_high": ci_high["tokens_per_char"]
+    }).reset_index()
 
-    # Figure 1: prompt tokens vs chars with regression lines (GPT-5.1, EN vs TR)
-    sub_en = df[(df.model == model_ref) & (df.variant == "en")]
-    sub_tr = df[(df.model == model_ref) & (df.variant == "tr")]
 
-    def linreg(sub):
-        X = sub["chars"].values
-        y = sub["prompt_tokens"].values
-        mean_x = X.mean()
-        mean_y = y.mean()
-        Sxx = ((X - mean_x) ** 2).sum()
-        Sxy = ((X - mean_x) * (y - mean_y)).sum()
-        b = Sxy / Sxx
-        a = mean_y - b * mean_x
-        return a, b
+def compute_cost_stats(df: pd.DataFrame):
+    """Mean cost per sentence and TR/EN cost ratio per model."""
+    mean_cost = (
+        df[df.variant.isin(["en", "tr"])]
+        .groupby(["model", "variant"], sort=True, observed=True)["cost"]
+        .mean()
+        .unstack("variant")
+        .reindex(columns=["en", "tr"])
+    )
+    en_cost = mean_cost["en"]
+    tr_cost = mean_cost["tr"]
+    ratio = (tr_cost / en_cost).where(en_cost > 0)
+
+    return pd.DataFrame({
+        "mean_cost_en": en_cost,
+        "mean_cost_tr": tr_cost,
+        "tr_over_en_cost_ratio": ratio
+    }).rename_axis(index="model", columns=None).reset_index()
+
+
+# --------- Plotting ---------
 
-    a_en, b_en = linreg(sub_en)
-    a_tr, b_tr = linreg(sub_tr)
+def plot_fig1(path: Path, model_ref: str, en, tr, fit_en, fit_tr, x_vals):
+    """Figure 1: prompt tokens vs chars with EN/TR regression lines for model_ref."""
+    a_en, b_en = fit_en
+    a_tr, b_tr = fit_tr
 
     fig1, ax1 = plt.subplots()
-    ax1.scatter(sub_en["chars"], sub_en["prompt_tokens"], label="English", alpha=0.6)
-    ax1.scatter(sub_tr["chars"], sub_tr["prompt_tokens"], label="Turkish", alpha=0.6)
+    ax1.scatter(en[0], en[1], label="English", alpha=0.6)
+    ax1.scatter(tr[0], tr[1], label="Turkish", alpha=0.6)
 
-    x_vals = np.linspace(df["chars"].min(), df["chars"].max(), 100)
     ax1.plot(x_vals, a_en + b_en * x_vals, label="EN fit")
     ax1.plot(x_vals, a_tr + b_tr * x_vals, label="TR fit")
 
@@ -267,29 +375,17 @@ def generate_figures(df: pd.DataFrame):
     ax1.set_title(f"Prompt tokens vs characters for {model_ref}")
     ax1.legend()
     fig1.tight_layout()
-    fig1_path = FIGURES_DIR / "fig1_chars_vs_prompt_tokens_gpt5_1.png"
-    fig1.savefig(fig1_path, dpi=300)
+    fig1.savefig(path, **SAVEFIG_KWARGS)
     plt.close(fig1)
 
-    # Figure 2: tokens per character by variant and model (bar chart)
-    variants = ["en", "tr", "tr_nodia"]
-    summaries = []
-    for m in models:
-        for v in variants:
-            sub = df[(df.model == m) & (df.variant == v)]
-            summaries.append({
-                "model": m,
-                "variant": v,
-                "tokens_per_char_mean": sub["tokens_per_char"].mean()
-            })
-    summ_tokens = pd.DataFrame(summaries)
 
+def plot_fig2(path: Path, models, variants, tokens_lut):
+    """Figure 2: mean tokens per character by variant and model (bar chart)."""
     fig2, ax2 = plt.subplots()
     x = np.arange(len(variants))
     width = 0.35
     for i, m in enumerate(models):
-        means = [summ_tokens[(summ_tokens.model == m) & (summ_tokens.variant == v)]["tokens_per_char_mean"].iloc[0]
-                 for v in variants]
+        means = [tokens_lut.get((m, v), np.nan) for v in variants]
         ax2.bar(x + (i - 0.5) * width, means, width, label=m)
 
     ax2.set_xticks(x)
@@ -298,28 +394,17 @@ def generate_figures(df: pd.DataFrame):
     ax2.set_title("Tokens per character by language variant and model")
     ax2.legend()
     fig2.tight_layout()
-    fig2_path = FIGURES_DIR / "fig2_tokens_per_char_by_variant_and_model.png"
-    fig2.savefig(fig2_path, dpi=300)
+    fig2.savefig(path, **SAVEFIG_KWARGS)
     plt.close(fig2)
 
-    # Figure 3: mean cost per sentence EN vs TR by model
-    cost_rows = []
-    for m in models:
-        for v in ["en", "tr"]:
-            sub = df[(df.model == m) & (df.variant == v)]
-            cost_rows.append({
-                "model": m,
-                "variant": v,
-                "mean_cost": sub["cost"].mean()
-            })
-    cost_df_long = pd.DataFrame(cost_rows)
 
+def plot_fig3(path: Path, models, cost_lut):
+    """Figure 3: mean cost per sentence EN vs TR by model."""
     fig3, ax3 = plt.subplots()
     x = np.arange(len(models))
     width = 0.35
     for i, v in enumerate(["en", "tr"]):
-        means = [cost_df_long[(cost_df_long.model == m) & (cost_df_long.variant == v)]["mean_cost"].iloc[0]
-                 for m in models]
+        means = [cost_lut.get((m, v), np.nan) for m in models]
         ax3.bar(x + (i - 0.5) * width, means, width, label="English" if v == "en" else "Turkish")
 
     ax3.set_xticks(x)
@@ -328,32 +413,67 @@ def generate_figures(df: pd.DataFrame):
     ax3.set_title("Mean cost per sentence: English vs Turkish")
     ax3.legend()
     fig3.tight_layout()
-    fig3_path = FIGURES_DIR / "fig3_cost_per_sentence_en_vs_tr.png"
-    fig3.savefig(fig3_path, dpi=300)
+    fig3.savefig(path, **SAVEFIG_KWARGS)
     plt.close(fig3)
 
-    # Figure 4: histogram of per-sentence Δ tokens/char (TR − EN) for model_ref
-    en_ref = df[(df.model == model_ref) & (df.variant == "en")].set_index("id")
-    tr_ref = df[(df.model == model_ref) & (df.variant == "tr")].set_index("id")
-    ids = sorted(set(en_ref.index) & set(tr_ref.index))
-    diffs_tpc = np.array([tr_ref.loc[i, "tokens_per_char"] - en_ref.loc[i, "tokens_per_char"] for i in ids])
 
+def plot_fig4(path: Path, model_ref: str, diffs_tpc):
+    """Figure 4: histogram of per-sentence Δ tokens/char (TR − EN) for model_ref."""
     fig4, ax4 = plt.subplots()
     ax4.hist(diffs_tpc, bins=15)
     ax4.set_xlabel("Δ tokens per character (TR − EN)")
     ax4.set_ylabel("Number of sentences")
     ax4.set_title(f"Distribution of per-sentence Δ tokens/char for {model_ref}")
     fig4.tight_layout()
-    fig4_path = FIGURES_DIR / "fig4_hist_delta_tokens_per_char_tr_minus_en_gpt5_1.png"
-    fig4.savefig(fig4_path, dpi=300)
+    fig4.savefig(path, **SAVEFIG_KWARGS)
     plt.close(fig4)
 
-    return {
-        "fig1": fig1_path,
-        "fig2": fig2_path,
-        "fig3": fig3_path,
-        "fig4": fig4_path,
+
+def generate_figures(df: pd.DataFrame, summ_df: pd.DataFrame, en_tr_diffs: pd.DataFrame):
+    """
+    Render the four figures in parallel worker processes.
+
+    Only the small arrays and lookup tables each figure needs are computed
+    here and sent to the workers, not the full DataFrame.
+    """
+    models = df["model"].cat.categories.tolist()
+    model_ref = models[0]  # e.g. gpt-5.1
+
+    chars_min, chars_max = df["chars"].agg(["min", "max"])
+    x_vals = np.linspace(chars_min, chars_max, 100)
+
+    ref = df.loc[df.model == model_ref, ["variant", "chars", "prompt_tokens"]]
+    sub_en = ref[ref.variant == "en"]
+    sub_tr = ref[ref.variant == "tr"]
+    fits = summ_df.set_index(["model", "variant"])[["intercept_tokens", "slope_tokens_per_char"]]
+    ref_fits = fits.reindex([(model_ref, "en"), (model_ref, "tr")]).to_numpy()
+    means = df.groupby(["model", "variant"], observed=True)[["tokens_per_char", "cost"]].mean()
+
+    fig_paths = {
+        "fig1": FIGURES_DIR / "fig1_chars_vs_prompt_tokens_gpt5_1.png",
+        "fig2": FIGURES_DIR / "fig2_tokens_per_char_by_variant_and_model.png",
+        "fig3": FIGURES_DIR / "fig3_cost_per_sentence_en_vs_tr.png",
+        "fig4": FIGURES_DIR / "fig4_hist_delta_tokens_per_char_tr_minus_en_gpt5_1.png",
     }
+    jobs = [
+        (plot_fig1, fig_paths["fig1"], model_ref,
+         (sub_en["chars"].to_numpy(), sub_en["prompt_tokens"].to_numpy()),
+         (sub_tr["chars"].to_numpy(), sub_tr["prompt_tokens"].to_numpy()),
+         tuple(ref_fits[0]), tuple(ref_fits[1]),
+         x_vals),
+        (plot_fig2, fig_paths["fig2"], models, VARIANTS, means["tokens_per_char"].to_dict()),
+        (plot_fig3, fig_paths["fig3"], models, means["cost"].to_dict()),
+        (plot_fig4, fig_paths["fig4"], model_ref,
+         en_tr_diffs.loc[en_tr_diffs.index.get_level_values("model") == model_ref,
+                         "tokens_per_char"].to_numpy()),
+    ]
+
+    with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as ex:
+        futures = [ex.submit(fn, *args) for fn, *args in jobs]
+        for f in futures:
+            f.result()
+
+    return fig_paths
 
 
 # --------- Main entry point ---------
@@ -370,22 +490,23 @@ def main():
         sys.exit(1)
 
     print(f"[INFO] Loading data from: {csv_path}")
-    df = load_and_clean(csv_path)
+    df = load_cached(csv_path)
+    wide = pivot_variants(df)
 
     print("[INFO] Computing linear model summaries...")
     summ_df = compute_summaries(df)
 
     print("[INFO] Computing paired EN vs TR stats...")
-    paired_en_tr_df = compute_paired_en_tr(df)
+    paired_en_tr_df, en_tr_diffs = compute_paired_en_tr(wide)
 
     print("[INFO] Computing paired TR_NODIA vs TR stats...")
-    paired_tr_df = compute_paired_tr_nodia(df)
+    paired_tr_df = compute_paired_tr_nodia(wide)
 
     print("[INFO] Computing cost stats...")
     cost_df = compute_cost_stats(df)
 
     print("[INFO] Generating figures...")
-    fig_paths = generate_figures(df)
+    fig_paths = generate_figures(df, summ_df, en_tr_diffs)
 
     # ---- Print textual summary ----
     pd.set_option("display.width", 120)